@@ -222,13 +222,47 @@ const translations = {
 };
 
 const storageKey = "jungle-park-language";
+let currentLanguage = null;
+let storedLanguage = null;
+let translatableNodes = null;
+
+const keyPaths = new Map();
+
+function splitKey(path) {
+  let segments = keyPaths.get(path);
+  if (!segments) {
+    segments = path.split(".");
+    keyPaths.set(path, segments);
+  }
+
+  return segments;
+}
 
 const getValue = (object, path) =>
-  path.split(".").reduce((current, key) => (current && key in current ? current[key] : undefined), object);
+  splitKey(path).reduce((current, key) => (current && key in current ? current[key] : undefined), object);
+
+function parseAttributeRules(source) {
+  return source.split("|").reduce((rules, rule) => {
+    const separatorIndex = rule.indexOf(":");
+    if (separatorIndex !== -1) {
+      rules.push({
+        attribute: rule.slice(0, separatorIndex).trim(),
+        key: rule.slice(separatorIndex + 1).trim()
+      });
+    }
+
+    return rules;
+  }, []);
+}
 
 function saveLanguage(language) {
+  if (language === storedLanguage) {
+    return;
+  }
+
   try {
     localStorage.setItem(storageKey, language);
+    storedLanguage = language;
   } catch (_error) {
     // Ignore storage errors.
   }
@@ -238,6 +272,7 @@ function loadLanguage() {
   try {
     const savedLanguage = localStorage.getItem(storageKey);
     if (savedLanguage === "ru" || savedLanguage === "kk") {
+      storedLanguage = savedLanguage;
       return savedLanguage;
     }
   } catch (_error) {
@@ -247,12 +282,33 @@ function loadLanguage() {
   return navigator.language && navigator.language.toLowerCase().startsWith("kk") ? "kk" : "ru";
 }
 
+function getTranslatableNodes() {
+  if (!translatableNodes) {
+    translatableNodes = {
+      text: document.querySelectorAll("[data-i18n]"),
+      attributes: Array.from(document.querySelectorAll("[data-i18n-attr]"), (element) => ({
+        element,
+        rules: parseAttributeRules(element.dataset.i18nAttr)
+      })),
+      languageButtons: document.querySelectorAll("[data-lang-button]")
+    };
+  }
+
+  return translatableNodes;
+}
+
 function applyTranslations(language) {
+  if (language === currentLanguage) {
+    return;
+  }
+
+  currentLanguage = language;
   const locale = translations[language] || translations.ru;
+  const nodes = getTranslatableNodes();
 
   document.documentElement.lang = language === "kk" ? "kk" : "ru";
 
-  document.querySelectorAll("[data-i18n]").forEach((element) => {
+  nodes.text.forEach((element) => {
     const value = getValue(locale, element.dataset.i18n);
     if (typeof value === "string") {
       if (element.tagName === "TITLE") {
@@ -262,15 +318,8 @@ function applyTranslations(language) {
     }
   });
 
-  document.querySelectorAll("[data-i18n-attr]").forEach((element) => {
-    element.dataset.i18nAttr.split("|").forEach((rule) => {
-      const separatorIndex = rule.indexOf(":");
-      if (separatorIndex === -1) {
-        return;
-      }
-
-      const attribute = rule.slice(0, separatorIndex).trim();
-      const key = rule.slice(separatorIndex + 1).trim();
+  nodes.attributes.forEach(({ element, rules }) => {
+    rules.forEach(({ attribute, key }) => {
       const value = getValue(locale, key);
 
       if (typeof value === "string") {
@@ -279,7 +328,7 @@ function applyTranslations(language) {
     });
   });
 
-  document.querySelectorAll("[data-lang-button]").forEach((button) => {
+  nodes.languageButtons.forEach((button) => {
     const isActive = button.dataset.langButton === language;
     button.classList.toggle("is-active", isActive);
     button.setAttribute("aria-pressed", String(isActive));
@@ -291,7 +340,7 @@ function applyTranslations(language) {
 document.addEventListener("DOMContentLoaded", () => {
   applyTranslations(loadLanguage());
 
-  document.querySelectorAll("[data-lang-button]").forEach((button) => {
+  getTranslatableNodes().languageButtons.forEach((button) => {
     button.addEventListener("click", () => {
       applyTranslations(button.dataset.langButton);
     });